@@ -6,6 +6,7 @@ This demonstrates how to interact with the server programmatically.
 
 import asyncio
 import os
+from dotenv import load_dotenv
 from src.greenhouse_mcp import mcp
 
 async def example_usage():
@@ -14,6 +15,8 @@ async def example_usage():
     print("Greenhouse MCP Server - Example Usage\n")
     print("=" * 50)
     
+    load_dotenv()
+    
     # Ensure API key is set
     if not os.getenv("GREENHOUSE_API_KEY"):
         print("❌ Please set GREENHOUSE_API_KEY in your .env file")
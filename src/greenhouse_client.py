@@ -1,11 +1,34 @@
 import os
+import asyncio
 import base64
+import logging
+import random
 import time
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Mapping
 import httpx
-from dotenv import load_dotenv
+import orjson
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# (endpoint, sorted query params)
+_CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+@lru_cache(maxsize=None)
+def _default_headers(api_key: str) -> Mapping[str, str]:
+    """Build the (immutable) auth headers once per API key."""
+    auth_string = base64.b64encode(f"{api_key}:".encode()).decode()
+    return MappingProxyType({
+        "Authorization": f"Basic {auth_string}",
+        "Content-Type": "application/json",
+    })
+
+
+def _compact(**values: Any) -> Dict[str, Any]:
+    """Drop unset (None) values so they are not sent to the API."""
+    return {k: v for k, v in values.items() if v is not None}
 
 
 class GreenhouseClient:
@@ -16,64 +39,249 @@ class GreenhouseClient:
         
         self.base_url = os.getenv("GREENHOUSE_BASE_URL", "https://harvest.greenhouse.io/v1")
         
-        auth_string = base64.b64encode(f"{self.api_key}:".encode()).decode()
-        self.headers = {
-            "Authorization": f"Basic {auth_string}",
-            "Content-Type": "application/json",
-        }
+        self.headers = _default_headers(self.api_key)
         
-        self._last_request_time = 0
-        self._request_count = 0
         self._rate_limit_window = 10
         self._rate_limit_max = 50
-    
-    def _rate_limit(self):
-        current_time = time.time()
-        if current_time - self._last_request_time > self._rate_limit_window:
-            self._request_count = 0
-            self._last_request_time = current_time
+        self._tokens = float(self._rate_limit_max)
+        self._refill_rate = self._rate_limit_max / self._rate_limit_window
+        self._last_refill = time.monotonic()
+        self._rate_limit_lock = asyncio.Lock()
+        
+        self._max_attempts = 5
+        self._retry_statuses = {502, 503, 504}
         
-        if self._request_count >= self._rate_limit_max:
-            sleep_time = self._rate_limit_window - (current_time - self._last_request_time)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-                self._request_count = 0
-                self._last_request_time = time.time()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._logged_http_version = False
         
-        self._request_count += 1
+        # Seconds to cache GET responses per resource; mostly-static org data
+        # lives longest. Resources not listed here are never cached.
+        self._cache_ttl = {
+            "jobs": 300,
+            "job_stages": 600,
+            "departments": 3600,
+            "offices": 3600,
+            "users": 300,
+        }
+        # Raw response bodies keyed by request, with their expiry time. Bodies
+        # are decoded on every hit so callers never share (and mutate) results.
+        self._cache: Dict[_CacheKey, Tuple[float, bytes]] = {}
+        self._cache_max_entries = 1024
     
-    async def _make_request(
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=True,
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        # Detach first so a request that starts while this awaits opens a
+        # fresh pool instead of having it dropped from under it.
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+    
+    async def __aenter__(self) -> "GreenhouseClient":
+        self._get_client()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    def _refill_tokens(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self._rate_limit_max,
+            self._tokens + (now - self._last_refill) * self._refill_rate
+        )
+        self._last_refill = now
+    
+    async def _rate_limit(self):
+        # Token bucket: refills continuously at 50 requests / 10s instead of
+        # resetting a fixed window, so bursts are smoothed rather than stalled.
+        async with self._rate_limit_lock:
+            self._refill_tokens()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+                self._refill_tokens()
+            self._tokens -= 1
+    
+    async def _send(
         self, 
         method: str, 
         endpoint: str, 
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        self._rate_limit()
+    ) -> Tuple[httpx.Response, bytearray]:
+        """
+        Send a request, retrying rate-limited and transient failures.
         
-        url = f"{self.base_url}/{endpoint}"
+        The body is streamed into a single bytearray instead of being read
+        whole by httpx, so large list pages are not held in memory twice
+        (the chunk list plus the joined bytes) before parsing.
+        """
+        client = self._get_client()
+        # Serialize once so retries resend the same bytes.
+        content = orjson.dumps(json_data) if json_data is not None else None
         
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+        for attempt in range(self._max_attempts):
+            await self._rate_limit()
+            
+            request = client.build_request(
                 method=method,
-                url=url,
-                headers=self.headers,
+                url=endpoint,
                 params=params,
-                json=json_data,
-                timeout=30.0
+                content=content
             )
+            response = await client.send(request, stream=True)
             
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 10))
-                time.sleep(retry_after)
-                return await self._make_request(method, endpoint, params, json_data)
+            try:
+                if not self._logged_http_version:
+                    logger.debug(
+                        "Greenhouse API negotiated %s (content-encoding: %s)",
+                        response.http_version,
+                        response.headers.get("content-encoding", "identity")
+                    )
+                    self._logged_http_version = True
+                
+                if response.status_code == 429:
+                    delay = int(response.headers.get("Retry-After", 10))
+                elif response.status_code in self._retry_statuses:
+                    delay = min(30, 2 ** attempt)
+                else:
+                    await self._raise_for_status(response)
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        body.extend(chunk)
+                    return response, body
+                
+                if attempt == self._max_attempts - 1:
+                    await self._raise_for_status(response)
+            finally:
+                await response.aclose()
             
+            await asyncio.sleep(delay + random.uniform(0, 0.5))
+    
+    @staticmethod
+    async def _raise_for_status(response: httpx.Response) -> None:
+        if not response.is_success:
+            # Streamed bodies aren't read yet; read it so the raised error
+            # keeps Greenhouse's error JSON (e.g. validation messages).
+            await response.aread()
             response.raise_for_status()
-            
-            if response.status_code == 204:
-                return {}
-            
-            return response.json()
+    
+    async def _make_request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        resource = endpoint.split("/", 1)[0]
+        ttl = self._cache_ttl.get(resource) if method == "GET" else None
+        
+        if ttl:
+            cache_key = (endpoint, tuple(sorted((params or {}).items())))
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return orjson.loads(cached[1])
+        elif method != "GET":
+            self._invalidate_cache(resource)
+        
+        response, body = await self._send(method, endpoint, params, json_data)
+        
+        if response.status_code == 204:
+            return {}
+        
+        if ttl:
+            self._cache_store(cache_key, ttl, bytes(body))
+        return orjson.loads(body)
+    
+    def _cache_store(self, key: _CacheKey, ttl: float, body: bytes) -> None:
+        now = time.monotonic()
+        # Re-insert so dict order stays oldest-first.
+        self._cache.pop(key, None)
+        if len(self._cache) >= self._cache_max_entries:
+            expired = [k for k, (expires, _) in self._cache.items() if expires <= now]
+            for k in expired:
+                del self._cache[k]
+            while len(self._cache) >= self._cache_max_entries:
+                del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + ttl, body)
+    
+    def _invalidate_cache(self, resource: str) -> None:
+        for key in [k for k in self._cache if k[0].split("/", 1)[0] == resource]:
+            del self._cache[key]
+    
+    @staticmethod
+    def _url_params(url: str) -> Dict[str, Any]:
+        return dict(httpx.URL(url).params)
+    
+    async def _get_with_links(
+        self,
+        endpoint: str,
+        params: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one page and return it with the Link header's rel="next" URL."""
+        response, body = await self._send("GET", endpoint, params=params)
+        return orjson.loads(body), response.links.get("next", {}).get("url")
+    
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield pages by following Greenhouse's Link rel="next" URLs.
+        
+        Unlike incrementing `page`, this walks the cursor the API hands back,
+        so deep pages cost the same as the first one.
+        """
+        while True:
+            results, next_url = await self._get_with_links(endpoint, params)
+            yield results
+            if next_url is None:
+                return
+            params = self._url_params(next_url)
+    
+    async def _list_all(
+        self,
+        endpoint: str,
+        params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a list endpoint.
+        
+        The first page is requested on its own to read the Link header. When
+        it advertises rel="last", the remaining pages are fetched concurrently;
+        otherwise the rel="next" cursor is followed page by page. No page goes
+        through the GET cache, so a listing never mixes fresh and stale pages.
+        """
+        params = {**params, "per_page": 500, "page": 1}
+        response, body = await self._send("GET", endpoint, params=params)
+        results = orjson.loads(body)
+        
+        last_url = response.links.get("last", {}).get("url")
+        next_url = response.links.get("next", {}).get("url")
+        if last_url:
+            last_page = int(httpx.URL(last_url).params.get("page", 1))
+            pages = await asyncio.gather(*(
+                self._get_with_links(endpoint, {**params, "page": page})
+                for page in range(2, last_page + 1)
+            ))
+            for page_results, _ in pages:
+                results.extend(page_results)
+        elif next_url:
+            next_params = self._url_params(next_url)
+            async for page_results in self._iter_pages(endpoint, next_params):
+                results.extend(page_results)
+        
+        return results
     
     async def list_jobs(
         self, 
@@ -83,19 +291,47 @@ class GreenhouseClient:
         created_after: Optional[str] = None,
         status: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        params = {
-            "per_page": per_page,
-            "page": page,
-        }
-        if created_before:
-            params["created_before"] = created_before
-        if created_after:
-            params["created_after"] = created_after
-        if status:
-            params["status"] = status
-            
+        params = _compact(
+            per_page=per_page,
+            page=page,
+            created_before=created_before,
+            created_after=created_after,
+            status=status
+        )
+        
         return await self._make_request("GET", "jobs", params=params)
     
+    async def list_all_jobs(
+        self,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        params = _compact(
+            created_before=created_before,
+            created_after=created_after,
+            status=status
+        )
+        
+        return await self._list_all("jobs", params)
+    
+    async def iter_jobs(
+        self,
+        per_page: int = 500,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        params = _compact(
+            per_page=per_page,
+            created_before=created_before,
+            created_after=created_after,
+            status=status
+        )
+        
+        async for page in self._iter_pages("jobs", params):
+            yield page
+    
     async def get_job(self, job_id: int) -> Dict[str, Any]:
         return await self._make_request("GET", f"jobs/{job_id}")
     
@@ -108,21 +344,52 @@ class GreenhouseClient:
         email: Optional[str] = None,
         candidate_ids: Optional[List[int]] = None
     ) -> List[Dict[str, Any]]:
-        params = {
-            "per_page": per_page,
-            "page": page,
-        }
-        if created_before:
-            params["created_before"] = created_before
-        if created_after:
-            params["created_after"] = created_after
-        if email:
-            params["email"] = email
-        if candidate_ids:
-            params["candidate_ids"] = ",".join(map(str, candidate_ids))
-            
+        params = _compact(
+            per_page=per_page,
+            page=page,
+            created_before=created_before,
+            created_after=created_after,
+            email=email,
+            candidate_ids=",".join(map(str, candidate_ids)) if candidate_ids else None
+        )
+        
         return await self._make_request("GET", "candidates", params=params)
     
+    async def list_all_candidates(
+        self,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+        email: Optional[str] = None,
+        candidate_ids: Optional[List[int]] = None
+    ) -> List[Dict[str, Any]]:
+        params = _compact(
+            created_before=created_before,
+            created_after=created_after,
+            email=email,
+            candidate_ids=",".join(map(str, candidate_ids)) if candidate_ids else None
+        )
+        
+        return await self._list_all("candidates", params)
+    
+    async def iter_candidates(
+        self,
+        per_page: int = 500,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+        email: Optional[str] = None,
+        candidate_ids: Optional[List[int]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        params = _compact(
+            per_page=per_page,
+            created_before=created_before,
+            created_after=created_after,
+            email=email,
+            candidate_ids=",".join(map(str, candidate_ids)) if candidate_ids else None
+        )
+        
+        async for page in self._iter_pages("candidates", params):
+            yield page
+    
     async def get_candidate(self, candidate_id: int) -> Dict[str, Any]:
         return await self._make_request("GET", f"candidates/{candidate_id}")
     
@@ -142,38 +409,91 @@ class GreenhouseClient:
         candidate_id: Optional[int] = None,
         status: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        params = {
-            "per_page": per_page,
-            "page": page,
-        }
-        if created_before:
-            params["created_before"] = created_before
-        if created_after:
-            params["created_after"] = created_after
-        if job_id:
-            params["job_id"] = job_id
-        if candidate_id:
-            params["candidate_id"] = candidate_id
-        if status:
-            params["status"] = status
-            
+        params = _compact(
+            per_page=per_page,
+            page=page,
+            created_before=created_before,
+            created_after=created_after,
+            job_id=job_id,
+            candidate_id=candidate_id,
+            status=status
+        )
+        
         return await self._make_request("GET", "applications", params=params)
     
+    async def list_all_applications(
+        self,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+        job_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        params = _compact(
+            created_before=created_before,
+            created_after=created_after,
+            job_id=job_id,
+            candidate_id=candidate_id,
+            status=status
+        )
+        
+        return await self._list_all("applications", params)
+    
+    async def iter_applications(
+        self,
+        per_page: int = 500,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+        job_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        params = _compact(
+            per_page=per_page,
+            created_before=created_before,
+            created_after=created_after,
+            job_id=job_id,
+            candidate_id=candidate_id,
+            status=status
+        )
+        
+        async for page in self._iter_pages("applications", params):
+            yield page
+    
     async def get_application(self, application_id: int) -> Dict[str, Any]:
         return await self._make_request("GET", f"applications/{application_id}")
     
+    async def get_application_with_stage(self, application_id: int) -> Dict[str, Any]:
+        """
+        Get an application with its current stage's details attached.
+        
+        The stage lookup needs current_stage.id from the application, so the
+        two requests are sequential; the stage side is usually served from
+        the job_stages cache.
+        
+        Args:
+            application_id: The Greenhouse application ID
+        
+        Returns:
+            Application object with an added "current_stage_detail" key
+            (None if the application has no current stage)
+        """
+        application = await self.get_application(application_id)
+        current_stage = application.get("current_stage")
+        stage = await self.get_job_stage(current_stage["id"]) if current_stage else None
+        return {**application, "current_stage_detail": stage}
+    
     async def advance_application(
         self, 
         application_id: int, 
         from_stage_id: int,
         to_stage_id: Optional[int] = None
     ) -> Dict[str, Any]:
-        data = {
-            "from_stage_id": from_stage_id,
-        }
-        if to_stage_id:
-            data["to_stage_id"] = to_stage_id
-            
+        data = _compact(
+            from_stage_id=from_stage_id,
+            to_stage_id=to_stage_id
+        )
+        
         return await self._make_request(
             "POST", 
             f"applications/{application_id}/advance",
@@ -187,14 +507,12 @@ class GreenhouseClient:
         notes: Optional[str] = None,
         rejection_email_id: Optional[int] = None
     ) -> Dict[str, Any]:
-        data = {}
-        if rejection_reason_id:
-            data["rejection_reason_id"] = rejection_reason_id
-        if notes:
-            data["notes"] = notes
-        if rejection_email_id:
-            data["rejection_email_send_email_at"] = rejection_email_id
-            
+        data = _compact(
+            rejection_reason_id=rejection_reason_id,
+            notes=notes,
+            rejection_email_send_email_at=rejection_email_id
+        )
+        
         return await self._make_request(
             "POST",
             f"applications/{application_id}/reject",
@@ -261,13 +579,12 @@ class GreenhouseClient:
         page: int = 1,
         email: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        params = {
-            "per_page": per_page,
-            "page": page,
-        }
-        if email:
-            params["email"] = email
-            
+        params = _compact(
+            per_page=per_page,
+            page=page,
+            email=email
+        )
+        
         return await self._make_request("GET", "users", params=params)
     
     async def list_job_stages(
@@ -291,17 +608,14 @@ class GreenhouseClient:
         Returns:
             List of job stage objects
         """
-        params = {
-            "per_page": per_page,
-            "page": page,
-        }
-        if job_id:
-            params["job_id"] = job_id
-        if created_after:
-            params["created_after"] = created_after
-        if created_before:
-            params["created_before"] = created_before
-            
+        params = _compact(
+            per_page=per_page,
+            page=page,
+            job_id=job_id,
+            created_after=created_after,
+            created_before=created_before
+        )
+        
         return await self._make_request("GET", "job_stages", params=params)
     
     async def get_job_stage(self, job_stage_id: int) -> Dict[str, Any]:
@@ -1,37 +1,149 @@
 #!/usr/bin/env python3
 import os
 import json
-from typing import Optional, List, Dict, Any
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import (
+    Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, TypeVar
+)
 from fastmcp import FastMCP, Context
-from dotenv import load_dotenv
 
-from .greenhouse_client import GreenhouseClient
-from .models import (
-    Job, Candidate, Application, Note,
-    CandidateCreateRequest, ApplicationAdvanceRequest
+from .greenhouse_client import GreenhouseClient, _compact
+
+T = TypeVar("T")
+
+# One client per event loop, kept for the loop's lifetime: an httpx connection
+# pool can't be shared across loops, and entries disappear along with their
+# loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, GreenhouseClient]" = (
+    weakref.WeakKeyDictionary()
 )
+# Open MCP sessions per event loop.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
-load_dotenv()
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Close this loop's Greenhouse HTTP connection pool once its last session ends.
+    
+    FastMCP enters the lifespan once per session (every SSE or streamable-HTTP
+    connection), not once per process, so the pool stays open while any other
+    session on the loop may still be using it. The client itself is kept, so
+    its rate limiter and cache carry over and the next request simply reopens
+    the pool.
+    """
+    loop = asyncio.get_running_loop()
+    _sessions[loop] = _sessions.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _sessions[loop] -= 1
+        if not _sessions[loop]:
+            client = _clients.get(loop)
+            if client is not None:
+                await client.aclose()
 
-mcp = FastMCP("Greenhouse API 🌱")
+
+mcp = FastMCP("Greenhouse API 🌱", lifespan=lifespan)
 mcp.description = "MCP server for interacting with Greenhouse Harvest API"
 
-client: Optional[GreenhouseClient] = None
+
+def _load_env() -> None:
+    """Load .env only when the API key isn't already in the environment."""
+    if os.getenv("GREENHOUSE_API_KEY") is None:
+        from dotenv import load_dotenv
+        load_dotenv()
 
 
 def get_client() -> GreenhouseClient:
-    global client
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
     if client is None:
+        _load_env()
         api_key = os.getenv("GREENHOUSE_API_KEY")
         if not api_key:
             raise ValueError(
                 "GREENHOUSE_API_KEY environment variable is required. "
                 "Please set it in your .env file or environment."
             )
-        client = GreenhouseClient(api_key)
+        client = _clients[loop] = GreenhouseClient(api_key)
     return client
 
 
+async def _run_tool(
+    ctx: Optional[Context],
+    call: Callable[[GreenhouseClient], Awaitable[T]],
+    describe: Callable[[T], str],
+    failure: str
+) -> T:
+    """
+    Shared body for every tool: run `call` against the Greenhouse client and
+    report the outcome to the MCP context.
+    """
+    try:
+        result = await call(get_client())
+        if ctx:
+            await ctx.info(describe(result))
+        return result
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"{failure}: {str(e)}")
+        raise
+
+
+def _describe_candidate(candidate: Dict[str, Any]) -> str:
+    name = f"{candidate.get('first_name', '')} {candidate.get('last_name', '')}"
+    return f"Retrieved candidate: {name.strip() or 'Unknown'}"
+
+
+def _describe_job_stage(stage: Dict[str, Any]) -> str:
+    stage_name = stage.get("name", "Unknown")
+    interview_count = len(stage.get("interviews", []))
+    return f"Retrieved job stage: {stage_name} ({interview_count} interviews)"
+
+
+def _describe_bulk(results: List[Dict[str, Any]], label: str) -> str:
+    failed = sum(1 for r in results if "error" in r)
+    return f"Retrieved {len(results) - failed} of {len(results)} {label}"
+
+
+def _candidate_fields(
+    first_name: Optional[str],
+    last_name: Optional[str],
+    email: Optional[str],
+    phone: Optional[str],
+    company: Optional[str],
+    title: Optional[str],
+    tags: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Build a candidate payload from tool arguments, leaving out unset fields."""
+    return _compact(
+        first_name=first_name,
+        last_name=last_name,
+        email_addresses=[{"value": email, "type": "personal"}] if email else None,
+        phone_numbers=[{"value": phone, "type": "mobile"}] if phone else None,
+        company=company,
+        title=title,
+        tags=tags or None,
+    )
+
+
+async def _fetch_many(
+    ids: List[int],
+    fetch: Callable[[int], Awaitable[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """Fetch resources concurrently, reporting per-ID failures instead of raising."""
+    results = await asyncio.gather(*(fetch(i) for i in ids), return_exceptions=True)
+    return [
+        {"id": i, "error": str(r)} if isinstance(r, Exception) else {"id": i, "data": r}
+        for i, r in zip(ids, results)
+    ]
+
+
 @mcp.tool
 async def list_jobs(
     per_page: int = 50,
@@ -54,22 +166,48 @@ async def list_jobs(
     Returns:
         List of job objects
     """
-    try:
-        gh_client = get_client()
-        jobs = await gh_client.list_jobs(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_jobs(
             per_page=per_page,
             page=page,
             status=status,
             created_after=created_after,
             created_before=created_before
-        )
-        if ctx:
-            ctx.info(f"Retrieved {len(jobs)} jobs")
-        return jobs
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to list jobs: {str(e)}")
-        raise
+        ),
+        lambda jobs: f"Retrieved {len(jobs)} jobs",
+        "Failed to list jobs"
+    )
+
+
+@mcp.tool
+async def list_all_jobs(
+    status: Optional[str] = None,
+    created_after: Optional[str] = None,
+    created_before: Optional[str] = None,
+    ctx: Context = None
+) -> List[Dict[str, Any]]:
+    """
+    List every job in Greenhouse, fetching all pages concurrently.
+    
+    Args:
+        status: Filter by job status (open, closed, draft)
+        created_after: ISO 8601 date to filter jobs created after
+        created_before: ISO 8601 date to filter jobs created before
+    
+    Returns:
+        List of all matching job objects
+    """
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_all_jobs(
+            status=status,
+            created_after=created_after,
+            created_before=created_before
+        ),
+        lambda jobs: f"Retrieved {len(jobs)} jobs",
+        "Failed to list all jobs"
+    )
 
 
 @mcp.tool
@@ -86,16 +224,35 @@ async def get_job(
     Returns:
         Job object with full details
     """
-    try:
-        gh_client = get_client()
-        job = await gh_client.get_job(job_id)
-        if ctx:
-            ctx.info(f"Retrieved job: {job.get('name', 'Unknown')}")
-        return job
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to get job {job_id}: {str(e)}")
-        raise
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.get_job(job_id),
+        lambda job: f"Retrieved job: {job.get('name', 'Unknown')}",
+        f"Failed to get job {job_id}"
+    )
+
+
+@mcp.tool
+async def get_jobs_bulk(
+    job_ids: List[int],
+    ctx: Context = None
+) -> List[Dict[str, Any]]:
+    """
+    Get several jobs at once, fetched concurrently.
+    
+    Args:
+        job_ids: IDs of the jobs to retrieve
+    
+    Returns:
+        One entry per ID: {"id": ..., "data": {...}} on success or
+        {"id": ..., "error": "..."} if that job could not be fetched
+    """
+    return await _run_tool(
+        ctx,
+        lambda gh: _fetch_many(job_ids, gh.get_job),
+        lambda results: _describe_bulk(results, "jobs"),
+        "Failed to get jobs"
+    )
 
 
 @mcp.tool
@@ -122,23 +279,52 @@ async def list_candidates(
     Returns:
         List of candidate objects
     """
-    try:
-        gh_client = get_client()
-        candidates = await gh_client.list_candidates(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_candidates(
             per_page=per_page,
             page=page,
             email=email,
             candidate_ids=candidate_ids,
             created_after=created_after,
             created_before=created_before
-        )
-        if ctx:
-            ctx.info(f"Retrieved {len(candidates)} candidates")
-        return candidates
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to list candidates: {str(e)}")
-        raise
+        ),
+        lambda candidates: f"Retrieved {len(candidates)} candidates",
+        "Failed to list candidates"
+    )
+
+
+@mcp.tool
+async def list_all_candidates(
+    email: Optional[str] = None,
+    candidate_ids: Optional[List[int]] = None,
+    created_after: Optional[str] = None,
+    created_before: Optional[str] = None,
+    ctx: Context = None
+) -> List[Dict[str, Any]]:
+    """
+    List every candidate in Greenhouse, fetching all pages concurrently.
+    
+    Args:
+        email: Filter by candidate email address
+        candidate_ids: List of specific candidate IDs to retrieve
+        created_after: ISO 8601 date to filter candidates created after
+        created_before: ISO 8601 date to filter candidates created before
+    
+    Returns:
+        List of all matching candidate objects
+    """
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_all_candidates(
+            email=email,
+            candidate_ids=candidate_ids,
+            created_after=created_after,
+            created_before=created_before
+        ),
+        lambda candidates: f"Retrieved {len(candidates)} candidates",
+        "Failed to list all candidates"
+    )
 
 
 @mcp.tool
@@ -155,17 +341,35 @@ async def get_candidate(
     Returns:
         Candidate object with full details
     """
-    try:
-        gh_client = get_client()
-        candidate = await gh_client.get_candidate(candidate_id)
-        if ctx:
-            name = f"{candidate.get('first_name', '')} {candidate.get('last_name', '')}"
-            ctx.info(f"Retrieved candidate: {name.strip() or 'Unknown'}")
-        return candidate
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to get candidate {candidate_id}: {str(e)}")
-        raise
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.get_candidate(candidate_id),
+        _describe_candidate,
+        f"Failed to get candidate {candidate_id}"
+    )
+
+
+@mcp.tool
+async def get_candidates_bulk(
+    candidate_ids: List[int],
+    ctx: Context = None
+) -> List[Dict[str, Any]]:
+    """
+    Get several candidates at once, fetched concurrently.
+    
+    Args:
+        candidate_ids: IDs of the candidates to retrieve
+    
+    Returns:
+        One entry per ID: {"id": ..., "data": {...}} on success or
+        {"id": ..., "error": "..."} if that candidate could not be fetched
+    """
+    return await _run_tool(
+        ctx,
+        lambda gh: _fetch_many(candidate_ids, gh.get_candidate),
+        lambda results: _describe_bulk(results, "candidates"),
+        "Failed to get candidates"
+    )
 
 
 @mcp.tool
@@ -194,43 +398,16 @@ async def create_candidate(
     Returns:
         Created candidate object
     """
-    try:
-        gh_client = get_client()
-        
-        candidate_data = {
-            "first_name": first_name,
-            "last_name": last_name,
-        }
-        
-        if email:
-            candidate_data["email_addresses"] = [
-                {"value": email, "type": "personal"}
-            ]
-        
-        if phone:
-            candidate_data["phone_numbers"] = [
-                {"value": phone, "type": "mobile"}
-            ]
-        
-        if company:
-            candidate_data["company"] = company
-        
-        if title:
-            candidate_data["title"] = title
-        
-        if tags:
-            candidate_data["tags"] = tags
-        
-        candidate = await gh_client.create_candidate(candidate_data)
-        
-        if ctx:
-            ctx.info(f"Created candidate: {first_name} {last_name}")
-        
-        return candidate
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to create candidate: {str(e)}")
-        raise
+    candidate_data = _candidate_fields(
+        first_name, last_name, email, phone, company, title, tags
+    )
+    
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.create_candidate(candidate_data),
+        lambda candidate: f"Created candidate: {first_name} {last_name}",
+        "Failed to create candidate"
+    )
 
 
 @mcp.tool
@@ -261,46 +438,16 @@ async def update_candidate(
     Returns:
         Updated candidate object
     """
-    try:
-        gh_client = get_client()
-        
-        update_data = {}
-        
-        if first_name:
-            update_data["first_name"] = first_name
-        
-        if last_name:
-            update_data["last_name"] = last_name
-        
-        if email:
-            update_data["email_addresses"] = [
-                {"value": email, "type": "personal"}
-            ]
-        
-        if phone:
-            update_data["phone_numbers"] = [
-                {"value": phone, "type": "mobile"}
-            ]
-        
-        if company:
-            update_data["company"] = company
-        
-        if title:
-            update_data["title"] = title
-        
-        if tags:
-            update_data["tags"] = tags
-        
-        candidate = await gh_client.update_candidate(candidate_id, update_data)
-        
-        if ctx:
-            ctx.info(f"Updated candidate ID: {candidate_id}")
-        
-        return candidate
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to update candidate {candidate_id}: {str(e)}")
-        raise
+    update_data = _candidate_fields(
+        first_name, last_name, email, phone, company, title, tags
+    )
+    
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.update_candidate(candidate_id, update_data),
+        lambda candidate: f"Updated candidate ID: {candidate_id}",
+        f"Failed to update candidate {candidate_id}"
+    )
 
 
 @mcp.tool
@@ -329,9 +476,9 @@ async def list_applications(
     Returns:
         List of application objects
     """
-    try:
-        gh_client = get_client()
-        applications = await gh_client.list_applications(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_applications(
             per_page=per_page,
             page=page,
             job_id=job_id,
@@ -339,14 +486,46 @@ async def list_applications(
             status=status,
             created_after=created_after,
             created_before=created_before
-        )
-        if ctx:
-            ctx.info(f"Retrieved {len(applications)} applications")
-        return applications
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to list applications: {str(e)}")
-        raise
+        ),
+        lambda applications: f"Retrieved {len(applications)} applications",
+        "Failed to list applications"
+    )
+
+
+@mcp.tool
+async def list_all_applications(
+    job_id: Optional[int] = None,
+    candidate_id: Optional[int] = None,
+    status: Optional[str] = None,
+    created_after: Optional[str] = None,
+    created_before: Optional[str] = None,
+    ctx: Context = None
+) -> List[Dict[str, Any]]:
+    """
+    List every application in Greenhouse, fetching all pages concurrently.
+    
+    Args:
+        job_id: Filter by job ID
+        candidate_id: Filter by candidate ID
+        status: Filter by application status
+        created_after: ISO 8601 date to filter applications created after
+        created_before: ISO 8601 date to filter applications created before
+    
+    Returns:
+        List of all matching application objects
+    """
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_all_applications(
+            job_id=job_id,
+            candidate_id=candidate_id,
+            status=status,
+            created_after=created_after,
+            created_before=created_before
+        ),
+        lambda applications: f"Retrieved {len(applications)} applications",
+        "Failed to list all applications"
+    )
 
 
 @mcp.tool
@@ -363,16 +542,76 @@ async def get_application(
     Returns:
         Application object with full details
     """
-    try:
-        gh_client = get_client()
-        application = await gh_client.get_application(application_id)
-        if ctx:
-            ctx.info(f"Retrieved application ID: {application_id}")
-        return application
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to get application {application_id}: {str(e)}")
-        raise
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.get_application(application_id),
+        lambda application: f"Retrieved application ID: {application_id}",
+        f"Failed to get application {application_id}"
+    )
+
+
+@mcp.tool
+async def get_application_with_stage(
+    application_id: int,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Get an application together with its current job stage details.
+    
+    Replaces the two-step get_application → get_job_stage flow with one call;
+    the stage (including its interviews[]) is attached as current_stage_detail.
+    Use this when preparing to advance an application or schedule interviews.
+    
+    Args:
+        application_id: The ID of the application to retrieve
+    
+    Returns:
+        Application object plus:
+        {
+            "current_stage_detail": {
+                "id": 24348514,
+                "name": "1st Round (CodeCollab)",
+                "interviews": [
+                    {
+                        "id": 37752251,
+                        "name": "Backend Coding Interview",
+                        "estimated_minutes": 60
+                    }
+                ]
+            }
+        }
+    """
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.get_application_with_stage(application_id),
+        lambda application: (
+            f"Retrieved application ID: {application_id} with current stage"
+        ),
+        f"Failed to get application {application_id} with stage"
+    )
+
+
+@mcp.tool
+async def get_applications_bulk(
+    application_ids: List[int],
+    ctx: Context = None
+) -> List[Dict[str, Any]]:
+    """
+    Get several applications at once, fetched concurrently.
+    
+    Args:
+        application_ids: IDs of the applications to retrieve
+    
+    Returns:
+        One entry per ID: {"id": ..., "data": {...}} on success or
+        {"id": ..., "error": "..."} if that application could not be fetched
+    """
+    return await _run_tool(
+        ctx,
+        lambda gh: _fetch_many(application_ids, gh.get_application),
+        lambda results: _describe_bulk(results, "applications"),
+        "Failed to get applications"
+    )
 
 
 @mcp.tool
@@ -393,20 +632,16 @@ async def advance_application(
     Returns:
         Success confirmation
     """
-    try:
-        gh_client = get_client()
-        result = await gh_client.advance_application(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.advance_application(
             application_id=application_id,
             from_stage_id=from_stage_id,
             to_stage_id=to_stage_id
-        )
-        if ctx:
-            ctx.info(f"Advanced application {application_id}")
-        return result
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to advance application {application_id}: {str(e)}")
-        raise
+        ),
+        lambda result: f"Advanced application {application_id}",
+        f"Failed to advance application {application_id}"
+    )
 
 
 @mcp.tool
@@ -427,20 +662,16 @@ async def reject_application(
     Returns:
         Success confirmation
     """
-    try:
-        gh_client = get_client()
-        result = await gh_client.reject_application(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.reject_application(
             application_id=application_id,
             rejection_reason_id=rejection_reason_id,
             notes=notes
-        )
-        if ctx:
-            ctx.info(f"Rejected application {application_id}")
-        return result
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to reject application {application_id}: {str(e)}")
-        raise
+        ),
+        lambda result: f"Rejected application {application_id}",
+        f"Failed to reject application {application_id}"
+    )
 
 
 @mcp.tool
@@ -461,20 +692,16 @@ async def add_note_to_candidate(
     Returns:
         Created note object
     """
-    try:
-        gh_client = get_client()
-        result = await gh_client.add_note_to_candidate(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.add_note_to_candidate(
             candidate_id=candidate_id,
             body=note,
             visibility=visibility
-        )
-        if ctx:
-            ctx.info(f"Added note to candidate {candidate_id}")
-        return result
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to add note to candidate {candidate_id}: {str(e)}")
-        raise
+        ),
+        lambda result: f"Added note to candidate {candidate_id}",
+        f"Failed to add note to candidate {candidate_id}"
+    )
 
 
 @mcp.tool
@@ -495,20 +722,16 @@ async def add_note_to_application(
     Returns:
         Created note object
     """
-    try:
-        gh_client = get_client()
-        result = await gh_client.add_note_to_application(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.add_note_to_application(
             application_id=application_id,
             body=note,
             visibility=visibility
-        )
-        if ctx:
-            ctx.info(f"Added note to application {application_id}")
-        return result
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to add note to application {application_id}: {str(e)}")
-        raise
+        ),
+        lambda result: f"Added note to application {application_id}",
+        f"Failed to add note to application {application_id}"
+    )
 
 
 @mcp.tool
@@ -527,19 +750,15 @@ async def list_departments(
     Returns:
         List of department objects
     """
-    try:
-        gh_client = get_client()
-        departments = await gh_client.list_departments(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_departments(
             per_page=per_page,
             page=page
-        )
-        if ctx:
-            ctx.info(f"Retrieved {len(departments)} departments")
-        return departments
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to list departments: {str(e)}")
-        raise
+        ),
+        lambda departments: f"Retrieved {len(departments)} departments",
+        "Failed to list departments"
+    )
 
 
 @mcp.tool
@@ -558,19 +777,15 @@ async def list_offices(
     Returns:
         List of office objects
     """
-    try:
-        gh_client = get_client()
-        offices = await gh_client.list_offices(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_offices(
             per_page=per_page,
             page=page
-        )
-        if ctx:
-            ctx.info(f"Retrieved {len(offices)} offices")
-        return offices
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to list offices: {str(e)}")
-        raise
+        ),
+        lambda offices: f"Retrieved {len(offices)} offices",
+        "Failed to list offices"
+    )
 
 
 @mcp.tool
@@ -591,20 +806,16 @@ async def list_users(
     Returns:
         List of user objects
     """
-    try:
-        gh_client = get_client()
-        users = await gh_client.list_users(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_users(
             per_page=per_page,
             page=page,
             email=email
-        )
-        if ctx:
-            ctx.info(f"Retrieved {len(users)} users")
-        return users
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to list users: {str(e)}")
-        raise
+        ),
+        lambda users: f"Retrieved {len(users)} users",
+        "Failed to list users"
+    )
 
 
 @mcp.tool
@@ -632,22 +843,18 @@ async def list_job_stages(
     Returns:
         List of job stage objects with id, name, job_id, etc.
     """
-    try:
-        gh_client = get_client()
-        stages = await gh_client.list_job_stages(
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.list_job_stages(
             per_page=per_page,
             page=page,
             job_id=job_id,
             created_after=created_after,
             created_before=created_before
-        )
-        if ctx:
-            ctx.info(f"Retrieved {len(stages)} job stages")
-        return stages
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to list job stages: {str(e)}")
-        raise
+        ),
+        lambda stages: f"Retrieved {len(stages)} job stages",
+        "Failed to list job stages"
+    )
 
 
 @mcp.tool
@@ -665,6 +872,8 @@ async def get_job_stage(
     1. get_application(app_id) → returns current_stage.id (e.g., 24348514)
     2. get_job_stage(24348514) → returns interviews[] for that stage
     
+    get_application_with_stage(app_id) does both steps in a single tool call.
+    
     Args:
         job_stage_id: The Greenhouse job stage ID (from application.current_stage.id)
     
@@ -678,29 +887,53 @@ async def get_job_stage(
             ]
         }
     """
-    try:
-        gh_client = get_client()
-        stage = await gh_client.get_job_stage(job_stage_id)
-        if ctx:
-            stage_name = stage.get("name", "Unknown")
-            interview_count = len(stage.get("interviews", []))
-            ctx.info(f"Retrieved job stage: {stage_name} ({interview_count} interviews)")
-        return stage
-    except Exception as e:
-        if ctx:
-            ctx.error(f"Failed to get job stage {job_stage_id}: {str(e)}")
-        raise
+    return await _run_tool(
+        ctx,
+        lambda gh: gh.get_job_stage(job_stage_id),
+        _describe_job_stage,
+        f"Failed to get job stage {job_stage_id}"
+    )
+
+
+@mcp.tool
+async def get_job_stages_bulk(
+    job_stage_ids: List[int],
+    ctx: Context = None
+) -> List[Dict[str, Any]]:
+    """
+    Get several job stages at once, fetched concurrently.
+    
+    Args:
+        job_stage_ids: IDs of the job stages to retrieve
+    
+    Returns:
+        One entry per ID: {"id": ..., "data": {...}} on success or
+        {"id": ..., "error": "..."} if that job stage could not be fetched
+    """
+    return await _run_tool(
+        ctx,
+        lambda gh: _fetch_many(job_stage_ids, gh.get_job_stage),
+        lambda results: _describe_bulk(results, "job stages"),
+        "Failed to get job stages"
+    )
 
 
 def main():
     """Main entry point for the MCP server."""
     import sys
     
+    _load_env()
     if not os.getenv("GREENHOUSE_API_KEY"):
         print("Error: GREENHOUSE_API_KEY environment variable is required", file=sys.stderr)
         print("Please set it in your .env file or environment.", file=sys.stderr)
         sys.exit(1)
     
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     mcp.run()
 
 
@@ -1,73 +1,204 @@
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
+from typing import (
+    TYPE_CHECKING, Optional, List, Tuple, Dict, Any, Annotated, Type, TypeVar
+)
 
-class Job(BaseModel):
+import msgspec
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    # Timestamps stay strings on the models, so datetime is only needed here.
+    from datetime import datetime
+    
+    if value is None:
+        return None
+    # fromisoformat() only accepts a trailing "Z" from Python 3.11 on.
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Response models are read-only DTOs decoded from API JSON. They never form
+# reference cycles, so gc=False keeps them out of the cyclic GC, and empty
+# array fields all share the immutable () instead of allocating a new list.
+class Department(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    id: int
+    name: str
+
+
+class Office(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    id: int
+    name: str
+
+
+class EmailAddress(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    value: str
+    type: Optional[str] = None
+
+
+class PhoneNumber(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    value: str
+    type: Optional[str] = None
+
+
+class StageRef(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    id: int
+    name: Optional[str] = None
+
+
+class JobRef(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    id: int
+    name: Optional[str] = None
+
+
+class Source(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    id: int
+    public_name: Optional[str] = None
+
+
+class UserRef(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    id: int
+    name: Optional[str] = None
+
+
+class RejectionReason(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    id: int
+    name: Optional[str] = None
+
+
+class Answer(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    question: str
+    answer: Optional[str] = None
+
+
+class Job(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     id: int
     name: str
     status: str
-    departments: List[Dict[str, Any]] = []
-    offices: List[Dict[str, Any]] = []
-    created_at: Optional[datetime] = None
-    opened_at: Optional[datetime] = None
-    closed_at: Optional[datetime] = None
+    departments: Tuple[Department, ...] = ()
+    offices: Tuple[Office, ...] = ()
+    created_at: Optional[str] = None
+    opened_at: Optional[str] = None
+    closed_at: Optional[str] = None
     requisition_id: Optional[str] = None
     notes: Optional[str] = None
+    
+    @property
+    def created_at_dt(self) -> Optional[datetime]:
+        return _parse_datetime(self.created_at)
+    
+    @property
+    def opened_at_dt(self) -> Optional[datetime]:
+        return _parse_datetime(self.opened_at)
+    
+    @property
+    def closed_at_dt(self) -> Optional[datetime]:
+        return _parse_datetime(self.closed_at)
 
 
-class Candidate(BaseModel):
+class Candidate(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     id: int
     first_name: str
     last_name: str
     company: Optional[str] = None
     title: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-    email_addresses: List[Dict[str, Any]] = []
-    phone_numbers: List[Dict[str, Any]] = []
-    addresses: List[Dict[str, Any]] = []
-    applications: List[Dict[str, Any]] = []
-    tags: List[str] = []
-    custom_fields: Dict[str, Any] = {}
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    email_addresses: Tuple[EmailAddress, ...] = ()
+    phone_numbers: Tuple[PhoneNumber, ...] = ()
+    addresses: Tuple[Dict[str, Any], ...] = ()
+    applications: Tuple[Dict[str, Any], ...] = ()
+    tags: Tuple[str, ...] = ()
+    custom_fields: Dict[str, Any] = msgspec.field(default_factory=dict)
+    
+    @property
+    def created_at_dt(self) -> Optional[datetime]:
+        return _parse_datetime(self.created_at)
+    
+    @property
+    def updated_at_dt(self) -> Optional[datetime]:
+        return _parse_datetime(self.updated_at)
 
 
-class Application(BaseModel):
+class Application(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     id: int
     candidate_id: int
     prospect: bool = False
-    applied_at: Optional[datetime] = None
-    rejected_at: Optional[datetime] = None
-    last_activity_at: Optional[datetime] = None
-    source: Optional[Dict[str, Any]] = None
-    credited_to: Optional[Dict[str, Any]] = None
-    rejection_reason: Optional[Dict[str, Any]] = None
+    applied_at: Optional[str] = None
+    rejected_at: Optional[str] = None
+    last_activity_at: Optional[str] = None
+    source: Optional[Source] = None
+    credited_to: Optional[UserRef] = None
+    rejection_reason: Optional[RejectionReason] = None
     rejection_details: Optional[Dict[str, Any]] = None
-    jobs: List[Dict[str, Any]] = []
+    jobs: Tuple[JobRef, ...] = ()
     job_post_id: Optional[int] = None
     status: str
-    current_stage: Optional[Dict[str, Any]] = None
-    answers: List[Dict[str, Any]] = []
-    custom_fields: Dict[str, Any] = {}
+    current_stage: Optional[StageRef] = None
+    answers: Tuple[Answer, ...] = ()
+    custom_fields: Dict[str, Any] = msgspec.field(default_factory=dict)
+    
+    @property
+    def applied_at_dt(self) -> Optional[datetime]:
+        return _parse_datetime(self.applied_at)
+    
+    @property
+    def rejected_at_dt(self) -> Optional[datetime]:
+        return _parse_datetime(self.rejected_at)
+    
+    @property
+    def last_activity_at_dt(self) -> Optional[datetime]:
+        return _parse_datetime(self.last_activity_at)
 
 
-class Note(BaseModel):
+class Note(msgspec.Struct, kw_only=True):
     body: str
-    visibility: str = Field(default="private", description="Options: 'admin_only', 'private', 'public'")
-    
+    visibility: Annotated[
+        str, msgspec.Meta(description="Options: 'admin_only', 'private', 'public'")
+    ] = "private"
+
 
-class CandidateCreateRequest(BaseModel):
+class CandidateCreateRequest(msgspec.Struct, kw_only=True, omit_defaults=True):
     first_name: str
     last_name: str
     company: Optional[str] = None
     title: Optional[str] = None
-    phone_numbers: Optional[List[Dict[str, str]]] = None
-    email_addresses: Optional[List[Dict[str, str]]] = None
+    phone_numbers: Optional[List[PhoneNumber]] = None
+    email_addresses: Optional[List[EmailAddress]] = None
     addresses: Optional[List[Dict[str, Any]]] = None
     tags: Optional[List[str]] = None
     custom_fields: Optional[List[Dict[str, Any]]] = None
-    
-    
-class ApplicationAdvanceRequest(BaseModel):
+
+
+class ApplicationAdvanceRequest(msgspec.Struct, kw_only=True, omit_defaults=True):
     from_stage_id: int
-    to_stage_id: Optional[int] = None
\ No newline at end of file
+    to_stage_id: Optional[int] = None
+
+
+# Reusable decoders for raw Greenhouse list responses: bytes go straight to
+# structs in one pass, with no intermediate dicts.
+JOB_LIST_DECODER = msgspec.json.Decoder(List[Job])
+CANDIDATE_LIST_DECODER = msgspec.json.Decoder(List[Candidate])
+APPLICATION_LIST_DECODER = msgspec.json.Decoder(List[Application])
+
+
+_ENCODER = msgspec.json.Encoder()
+
+S = TypeVar("S", bound=msgspec.Struct)
+
+
+def from_api(cls: Type[S], data: Dict[str, Any]) -> S:
+    """Build a model from an already-parsed API dict, e.g. a GreenhouseClient result."""
+    return msgspec.convert(data, cls)
+
+
+def to_json(obj: Any) -> bytes:
+    """Encode structs (or plain containers of them) to JSON bytes."""
+    return _ENCODER.encode(obj)
+
+
+def to_dict(obj: Any) -> Any:
+    """Convert structs (recursively) to plain builtins, e.g. for tool output."""
+    return msgspec.to_builtins(obj)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for GreenhouseClient's caching, pagination and retries, run against an
+httpx MockTransport instead of the real Harvest API.
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from src.greenhouse_client import GreenhouseClient
+
+BASE_URL = "https://harvest.greenhouse.io/v1"
+
+
+def make_client(handler):
+    gh = GreenhouseClient(api_key="test")
+    gh.base_url = BASE_URL
+    gh._client = httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers=gh.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return gh
+
+
+def json_response(data, **kwargs):
+    return httpx.Response(200, content=orjson.dumps(data), **kwargs)
+
+
+def page_links(page, last_page, include_last=True):
+    links = []
+    if page < last_page:
+        links.append(f'<{BASE_URL}/jobs?page={page + 1}&per_page=500>; rel="next"')
+    if include_last:
+        links.append(f'<{BASE_URL}/jobs?page={last_page}&per_page=500>; rel="last"')
+    return {"Link": ", ".join(links)} if links else {}
+
+
+@pytest.mark.asyncio
+async def test_cached_get_is_reused_and_not_shared():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return json_response({"id": 1, "name": "Engineer", "departments": []})
+
+    gh = make_client(handler)
+    first = await gh.get_job(1)
+    first["departments"].append({"id": 99})
+    second = await gh.get_job(1)
+
+    assert len(calls) == 1
+    assert second == {"id": 1, "name": "Engineer", "departments": []}
+    await gh.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_stays_bounded():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return json_response({"id": int(request.url.path.rsplit("/", 1)[1])})
+
+    gh = make_client(handler)
+    gh._cache_max_entries = 2
+    for job_id in (1, 2, 3):
+        await gh.get_job(job_id)
+    assert len(gh._cache) == 2
+
+    gh._cache_ttl["jobs"] = 0
+    await gh.get_job(3)
+    await gh.get_job(3)
+    assert len(calls) == 5
+    await gh.aclose()
+
+
+@pytest.mark.asyncio
+async def test_list_all_fetches_every_page_fresh():
+    version = 1
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        return json_response(
+            [{"id": page * 10 + 1, "v": version}],
+            headers=page_links(page, 3),
+        )
+
+    gh = make_client(handler)
+    assert await gh.list_all_jobs() == [
+        {"id": 11, "v": 1}, {"id": 21, "v": 1}, {"id": 31, "v": 1}
+    ]
+
+    version = 2
+    assert await gh.list_all_jobs() == [
+        {"id": 11, "v": 2}, {"id": 21, "v": 2}, {"id": 31, "v": 2}
+    ]
+    await gh.aclose()
+
+
+@pytest.mark.asyncio
+async def test_list_all_follows_next_cursor_without_last():
+    requested = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        requested.append(page)
+        return json_response(
+            [{"id": page}],
+            headers=page_links(page, 3, include_last=False),
+        )
+
+    gh = make_client(handler)
+    assert await gh.list_all_jobs() == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert requested == [1, 2, 3]
+    await gh.aclose()
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(monkeypatch):
+    statuses = [503, 429, 200]
+    delays = []
+
+    async def no_sleep(delay):
+        delays.append(delay)
+
+    def handler(request):
+        status = statuses.pop(0)
+        if status != 200:
+            return httpx.Response(status, headers={"Retry-After": "2"})
+        return json_response([{"id": 1}])
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    gh = make_client(handler)
+    assert await gh.list_candidates() == [{"id": 1}]
+    assert len(delays) == 2
+    assert 1 <= delays[0] < 1.5 and 2 <= delays[1] < 2.5
+    await gh.aclose()
+
+
+@pytest.mark.asyncio
+async def test_error_response_keeps_its_body():
+    async def error_body():
+        yield b'{"errors": [{"message": "first_name is required"}]}'
+
+    def handler(request):
+        return httpx.Response(422, content=error_body())
+
+    gh = make_client(handler)
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        await gh.create_candidate({"last_name": "Doe"})
+    assert excinfo.value.response.json() == {
+        "errors": [{"message": "first_name is required"}]
+    }
+    await gh.aclose()
+
+
+@pytest.mark.asyncio
+async def test_application_with_stage_uses_stage_cache():
+    stage_requests = []
+    applications = {
+        1: {"id": 1, "current_stage": {"id": 767358, "name": "Application Review"}},
+        2: {"id": 2, "current_stage": {"id": 767358, "name": "Application Review"}},
+        3: {"id": 3, "current_stage": None},
+    }
+
+    def handler(request):
+        resource, resource_id = request.url.path.rsplit("/", 2)[-2:]
+        if resource == "job_stages":
+            stage_requests.append(resource_id)
+            return json_response({"id": int(resource_id), "interviews": []})
+        return json_response(applications[int(resource_id)])
+
+    gh = make_client(handler)
+    first = await gh.get_application_with_stage(1)
+    second = await gh.get_application_with_stage(2)
+    without_stage = await gh.get_application_with_stage(3)
+
+    assert first["current_stage_detail"] == {"id": 767358, "interviews": []}
+    assert second["current_stage_detail"] == first["current_stage_detail"]
+    assert stage_requests == ["767358"]
+    assert without_stage["current_stage_detail"] is None
+    await gh.aclose()
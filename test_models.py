@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for the msgspec models, decoded from payloads shaped like real
+Greenhouse Harvest API responses (extra fields included).
+"""
+
+from datetime import datetime, timezone
+from typing import List
+
+import msgspec
+import orjson
+import pytest
+
+from src import models
+from src.models import (
+    Answer,
+    Application,
+    Candidate,
+    CandidateCreateRequest,
+    Department,
+    EmailAddress,
+    Job,
+    StageRef,
+    from_api,
+    to_dict,
+    to_json,
+)
+
+JOB = {
+    "id": 107761,
+    "name": "UX Designer - Boston",
+    "requisition_id": "abc-123",
+    "notes": "<p>Looking for the best!</p>",
+    "confidential": False,
+    "status": "open",
+    "created_at": "2013-12-10T14:42:58Z",
+    "opened_at": "2013-12-11T14:42:58Z",
+    "closed_at": None,
+    "is_template": False,
+    "departments": [
+        {
+            "id": 25907,
+            "name": "Marketing",
+            "parent_id": None,
+            "child_ids": [14510],
+            "external_id": "marketing-1",
+        }
+    ],
+    "offices": [
+        {
+            "id": 47012,
+            "name": "New York",
+            "location": {"name": "New York, United States"},
+            "primary_contact_user_id": 150893,
+            "parent_id": None,
+            "child_ids": [],
+        }
+    ],
+    "hiring_team": {"hiring_managers": [], "recruiters": [], "coordinators": []},
+    "openings": [{"id": 123, "opening_id": "3-1", "status": "open"}],
+}
+
+APPLICATION = {
+    "id": 69306314,
+    "candidate_id": 57683957,
+    "prospect": False,
+    "applied_at": "2017-09-29T12:56:05.244Z",
+    "rejected_at": None,
+    "last_activity_at": "2017-09-29T13:00:28.038Z",
+    "location": {"address": "New York, New York, USA"},
+    "source": {"id": 2, "public_name": "Jobs page on your website"},
+    "credited_to": {
+        "id": 4080,
+        "first_name": "Kate",
+        "last_name": "Austen",
+        "name": "Kate Austen",
+        "employee_id": "12345",
+    },
+    "rejection_reason": None,
+    "rejection_details": None,
+    "jobs": [{"id": 107761, "name": "UX Designer - Boston"}],
+    "job_post_id": 123,
+    "status": "active",
+    "current_stage": {"id": 767358, "name": "Application Review"},
+    "answers": [
+        {"question": "How did you hear about this job?", "answer": "Online Research"},
+        {"question": "Website", "answer": None},
+    ],
+    "prospective_office": None,
+    "prospective_department": None,
+    "custom_fields": {"application_custom_test": "Option 1"},
+    "attachments": [],
+}
+
+CANDIDATE = {
+    "id": 57683957,
+    "first_name": "John",
+    "last_name": "Locke",
+    "company": "The Tustin Box Company",
+    "title": "Customer Success Representative",
+    "created_at": "2017-09-29T12:56:05.244Z",
+    "updated_at": "2017-09-29T13:00:28.038Z",
+    "last_activity": "2017-09-29T13:00:28.038Z",
+    "is_private": False,
+    "photo_url": None,
+    "attachments": [],
+    "application_ids": [69306314],
+    "phone_numbers": [{"value": "555-555-5555", "type": "mobile"}],
+    "addresses": [{"value": "123 Fake St.", "type": "home"}],
+    "email_addresses": [{"value": "john.locke@example.com", "type": "personal"}],
+    "website_addresses": [],
+    "social_media_addresses": [],
+    "recruiter": None,
+    "coordinator": None,
+    "tags": ["Python", "Ruby"],
+    "applications": [APPLICATION],
+    "custom_fields": {"desired_salary": "1000"},
+}
+
+
+def test_list_decoders_handle_harvest_payloads():
+    jobs = models.JOB_LIST_DECODER.decode(orjson.dumps([JOB]))
+    candidates = models.CANDIDATE_LIST_DECODER.decode(orjson.dumps([CANDIDATE]))
+    applications = models.APPLICATION_LIST_DECODER.decode(
+        orjson.dumps([APPLICATION])
+    )
+
+    job = jobs[0]
+    assert job.departments == (Department(id=25907, name="Marketing"),)
+    assert job.offices[0].name == "New York"
+    assert job.closed_at is None
+
+    candidate = candidates[0]
+    assert candidate.email_addresses == (
+        EmailAddress(value="john.locke@example.com", type="personal"),
+    )
+    assert candidate.tags == ("Python", "Ruby")
+    assert candidate.applications[0]["id"] == 69306314
+
+    application = applications[0]
+    assert application.current_stage == StageRef(
+        id=767358, name="Application Review"
+    )
+    assert application.answers[1] == Answer(question="Website", answer=None)
+    assert application.source.public_name == "Jobs page on your website"
+    assert application.credited_to.name == "Kate Austen"
+    assert application.rejection_reason is None
+
+
+def test_timestamp_properties_parse_z_suffix():
+    job = from_api(Job, JOB)
+    application = from_api(Application, APPLICATION)
+
+    assert job.created_at_dt == datetime(2013, 12, 10, 14, 42, 58, tzinfo=timezone.utc)
+    assert job.closed_at_dt is None
+    assert application.applied_at_dt == datetime(
+        2017, 9, 29, 12, 56, 5, 244000, tzinfo=timezone.utc
+    )
+
+
+def test_from_api_matches_decoder_and_rejects_bad_types():
+    assert from_api(Candidate, CANDIDATE) == msgspec.json.decode(
+        orjson.dumps(CANDIDATE), type=Candidate
+    )
+    with pytest.raises(msgspec.ValidationError):
+        from_api(Application, {**APPLICATION, "current_stage": {"name": "No id"}})
+
+
+def test_to_json_and_to_dict_round_trip():
+    cases = ((Job, JOB), (Candidate, CANDIDATE), (Application, APPLICATION))
+    for model, payload in cases:
+        obj = from_api(model, payload)
+        assert msgspec.json.decode(to_json(obj), type=model) == obj
+        assert from_api(model, to_dict(obj)) == obj
+
+    jobs = models.JOB_LIST_DECODER.decode(orjson.dumps([JOB, JOB]))
+    assert msgspec.json.decode(to_json(jobs), type=List[Job]) == jobs
+
+
+def test_request_models_omit_unset_fields():
+    request = CandidateCreateRequest(first_name="John", last_name="Locke")
+    assert orjson.loads(to_json(request)) == {
+        "first_name": "John",
+        "last_name": "Locke",
+    }
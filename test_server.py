@@ -6,10 +6,51 @@ This tests that the server can be imported and initialized.
 
 import sys
 import os
+import asyncio
+import atexit
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+EXPECTED_TOOLS = frozenset({
+    "list_jobs",
+    "list_all_jobs",
+    "get_job",
+    "get_jobs_bulk",
+    "list_candidates",
+    "list_all_candidates",
+    "get_candidate",
+    "get_candidates_bulk",
+    "create_candidate",
+    "update_candidate",
+    "list_applications",
+    "list_all_applications",
+    "get_application",
+    "get_application_with_stage",
+    "get_applications_bulk",
+    "list_job_stages",
+    "get_job_stage",
+    "get_job_stages_bulk",
+    "advance_application",
+    "reject_application",
+    "add_note_to_candidate",
+    "add_note_to_application",
+    "list_departments",
+    "list_offices",
+    "list_users"
+})
+
+_loop = None
+
+
+def run_async(coro):
+    """Run a coroutine on one event loop shared by every check in this script."""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        atexit.register(_loop.close)
+    return _loop.run_until_complete(coro)
+
 def test_import():
     """Test that we can import the MCP server."""
     try:
@@ -23,7 +64,6 @@ def test_import():
 def test_tools():
     """Test that tools are registered."""
     try:
-        import asyncio
         from src.greenhouse_mcp import mcp
         
         async def check_tools():
@@ -31,37 +71,17 @@ def test_tools():
             return tools
         
         # Run async function
-        tools = asyncio.run(check_tools())
+        tools = run_async(check_tools())
         
         print(f"✅ Found {len(tools)} tools registered:")
         
-        expected_tools = [
-            "list_jobs",
-            "get_job",
-            "list_candidates",
-            "get_candidate",
-            "create_candidate",
-            "update_candidate",
-            "list_applications",
-            "get_application",
-            "list_job_stages",
-            "get_job_stage",
-            "advance_application",
-            "reject_application",
-            "add_note_to_candidate",
-            "add_note_to_application",
-            "list_departments",
-            "list_offices",
-            "list_users"
-        ]
-        
         # Get tool names from the registered tools
-        tool_names = [tool.name if hasattr(tool, 'name') else str(tool) for tool in tools]
+        tool_names = [getattr(tool, 'name', None) or str(tool) for tool in tools]
         
         for name in tool_names:
             print(f"   - {name}")
         
-        missing_tools = [t for t in expected_tools if t not in tool_names]
+        missing_tools = sorted(EXPECTED_TOOLS - set(tool_names))
         
         if missing_tools:
             print(f"⚠️  Missing expected tools: {missing_tools}")
@@ -74,6 +94,8 @@ def test_tools():
 
 def test_env_check():
     """Test environment variable configuration."""
+    from src.greenhouse_mcp import _load_env
+    _load_env()
     api_key = os.getenv("GREENHOUSE_API_KEY")
     
     if api_key: